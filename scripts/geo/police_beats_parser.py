@@ -4,73 +4,135 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 from collections import defaultdict
+from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+import numpy as np
+import shapely
 from pipeline.logging_config import configure_logging as configure_pipeline_logging, get_logger
-from geopy.distance import geodesic
-from shapely.geometry import Point, shape
+from shapely.geometry import Point, box, shape
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to loading the whole document.
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module.
+    orjson = None
+
+try:
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to the NumPy haversine matrix.
+    _HAS_NUMBA = False
+
+try:
+    from sklearn.neighbors import BallTree
+except ImportError:  # scikit-learn is optional; fall back to the brute-force haversine.
+    BallTree = None
+
 logger = get_logger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[4]
 DEFAULT_GEOJSON_PATH = PROJECT_ROOT / "pd_beats_datasd.geojson"
 DEFAULT_OUTPUT_PATH = PROJECT_ROOT / "beat_station_mapping.json"
-
-WEATHER_STATIONS: list[dict[str, Any]] = [
-    {
-        "station_id": "KSAN",
-        "name": "San Diego International Airport",
-        "lat": 32.7338,
-        "lon": -117.1933,
-        "location": "Coastal/Downtown",
-    },
-    {
-        "station_id": "KNZY",
-        "name": "North Island Naval Air Station",
-        "lat": 32.6992,
-        "lon": -117.2153,
-        "location": "Harbor/Coronado",
-    },
-    {
-        "station_id": "KSDM",
-        "name": "Brown Field Municipal",
-        "lat": 32.5723,
-        "lon": -116.9801,
-        "location": "South San Diego",
-    },
-    {
-        "station_id": "KMYF",
-        "name": "Montgomery-Gibbs Executive",
-        "lat": 32.8158,
-        "lon": -117.1394,
-        "location": "Kearny Mesa/Inland",
-    },
-    {
-        "station_id": "KRNM",
-        "name": "Ramona Airport",
-        "lat": 33.04111,
-        "lon": -116.91556,
-        "location": "North Inland/East County",
-    },
-    {
-        "station_id": "KSEE",
-        "name": "Gillespie Field",
-        "lat": 32.82472,
-        "lon": -116.97222,
-        "location": "East County/El Cajon",
-    },
-    {
-        "station_id": "KNKX",
-        "name": "MCAS Miramar",
-        "lat": 32.86833,
-        "lon": -117.14167,
-        "location": "North Inland/Miramar",
-    },
-]
+EARTH_RADIUS_KM = 6371.0088
+# Below this many stations the (B, S) haversine matrix beats building/querying a BallTree.
+BALLTREE_MIN_STATIONS = 32
+# (min_lon, min_lat, max_lon, max_lat) used to clip station Voronoi cells.
+SAN_DIEGO_COUNTY_BOUNDS = (-117.61, 32.53, -116.08, 33.51)
+ASSIGNMENT_METHODS = ("nearest", "voronoi")
+
+
+class Station(NamedTuple):
+    station_id: str
+    name: str
+    lat: float
+    lon: float
+    location: str
+
+
+WEATHER_STATIONS: tuple[Station, ...] = (
+    Station(
+        station_id="KSAN",
+        name="San Diego International Airport",
+        lat=32.7338,
+        lon=-117.1933,
+        location="Coastal/Downtown",
+    ),
+    Station(
+        station_id="KNZY",
+        name="North Island Naval Air Station",
+        lat=32.6992,
+        lon=-117.2153,
+        location="Harbor/Coronado",
+    ),
+    Station(
+        station_id="KSDM",
+        name="Brown Field Municipal",
+        lat=32.5723,
+        lon=-116.9801,
+        location="South San Diego",
+    ),
+    Station(
+        station_id="KMYF",
+        name="Montgomery-Gibbs Executive",
+        lat=32.8158,
+        lon=-117.1394,
+        location="Kearny Mesa/Inland",
+    ),
+    Station(
+        station_id="KRNM",
+        name="Ramona Airport",
+        lat=33.04111,
+        lon=-116.91556,
+        location="North Inland/East County",
+    ),
+    Station(
+        station_id="KSEE",
+        name="Gillespie Field",
+        lat=32.82472,
+        lon=-116.97222,
+        location="East County/El Cajon",
+    ),
+    Station(
+        station_id="KNKX",
+        name="MCAS Miramar",
+        lat=32.86833,
+        lon=-117.14167,
+        location="North Inland/Miramar",
+    ),
+)
+
+# Struct-of-arrays view of WEATHER_STATIONS, aligned by index, for the distance kernels.
+_ST_LAT = np.array([s.lat for s in WEATHER_STATIONS], dtype=np.float64)
+_ST_LON = np.array([s.lon for s in WEATHER_STATIONS], dtype=np.float64)
+_ST_LAT_RAD = np.radians(_ST_LAT)
+_ST_LON_RAD = np.radians(_ST_LON)
+_STATION_TREE = None
+_VORONOI_TREE = None
+
+
+@dataclass(slots=True)
+class RawBeat:
+    """One source GeoJSON feature; several may share a beat id before consolidation."""
+
+    objectid: int
+    beat: int
+    div: int | None
+    serv: int | None
+    name: str | None
+    geometry_type: str
+    geometry: BaseGeometry
 
 
 def parse_args() -> argparse.Namespace:
@@ -98,6 +160,15 @@ def parse_args() -> argparse.Namespace:
             "(default: --strict)."
         ),
     )
+    parser.add_argument(
+        "--assignment",
+        default="nearest",
+        choices=ASSIGNMENT_METHODS,
+        help=(
+            "Beat-to-station assignment: haversine nearest station, or point-in-cell "
+            "lookup against station Voronoi cells (default: nearest)."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -114,23 +185,25 @@ def configure_logging(level: str) -> None:
     )
 
 
-def validate_stations(stations: list[dict[str, Any]]) -> None:
+def validate_stations(stations: Sequence[Station]) -> None:
     if not stations:
         raise RuntimeError("No weather stations configured.")
 
-    seen: set[str] = set()
-    for station in stations:
-        station_id = station.get("station_id")
-        if not isinstance(station_id, str) or not station_id:
-            raise RuntimeError(f"Invalid station_id in station config: {station!r}")
-        if station_id in seen:
-            raise RuntimeError(f"Duplicate station_id in station config: {station_id}")
-        seen.add(station_id)
+    ids = [station.station_id for station in stations]
+    if not all(isinstance(station_id, str) and station_id for station_id in ids):
+        bad = next(i for i, v in enumerate(ids) if not isinstance(v, str) or not v)
+        raise RuntimeError(f"Invalid station_id in station config: {stations[bad]!r}")
+    if len(set(ids)) != len(ids):
+        duplicate = next(v for i, v in enumerate(ids) if v in ids[:i])
+        raise RuntimeError(f"Duplicate station_id in station config: {duplicate}")
 
 
 def load_geojson(file_path: Path) -> dict[str, Any]:
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(file_path.read_bytes())
+    else:
+        with file_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if data.get("type") != "FeatureCollection":
         raise RuntimeError("Input GeoJSON must be a FeatureCollection.")
@@ -141,10 +214,38 @@ def load_geojson(file_path: Path) -> dict[str, Any]:
     return data
 
 
-def extract_beats(geojson_data: dict[str, Any]) -> list[dict[str, Any]]:
-    beats: list[dict[str, Any]] = []
+def _check_feature_collection_stream(f) -> None:
+    # Event-level scan of top-level keys only; stops as soon as both are seen.
+    seen_type = None
+    features_is_list = None
+    for prefix, event, value in ijson.parse(f):
+        if prefix == "type" and event == "string":
+            seen_type = value
+        elif prefix == "features" and event in ("start_array", "start_map", "string", "number", "null", "boolean"):
+            features_is_list = event == "start_array"
+        if seen_type is not None and features_is_list is not None:
+            break
 
-    for i, feature in enumerate(geojson_data["features"]):
+    if seen_type != "FeatureCollection":
+        raise RuntimeError("Input GeoJSON must be a FeatureCollection.")
+    if not features_is_list:
+        raise RuntimeError("Input GeoJSON features must be a list.")
+
+
+def iter_features(file_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield GeoJSON features one at a time without holding the whole collection."""
+    if ijson is None:
+        yield from load_geojson(file_path)["features"]
+        return
+
+    with file_path.open("rb") as f:
+        _check_feature_collection_stream(f)
+        f.seek(0)
+        yield from ijson.items(f, "features.item", use_float=True)
+
+
+def extract_beats(features: Iterable[dict[str, Any]]) -> Iterator[RawBeat]:
+    for i, feature in enumerate(features):
         properties = feature.get("properties")
         geometry = feature.get("geometry")
         if not isinstance(properties, dict) or not isinstance(geometry, dict):
@@ -164,20 +265,16 @@ def extract_beats(geojson_data: dict[str, Any]) -> list[dict[str, Any]]:
         if "coordinates" not in geometry:
             raise RuntimeError(f"Feature index {i} missing geometry coordinates.")
 
-        beats.append(
-            {
-                "objectid": int(properties["objectid"]),
-                "beat": int(properties["beat"]),
-                "div": int(properties["div"]) if properties["div"] is not None else None,
-                "serv": int(properties["serv"]) if properties["serv"] is not None else None,
-                "name": properties.get("name"),
-                "geometry_type": geometry_type,
-                "coordinates": geometry["coordinates"],
-            }
+        yield RawBeat(
+            objectid=int(properties["objectid"]),
+            beat=int(properties["beat"]),
+            div=int(properties["div"]) if properties["div"] is not None else None,
+            serv=int(properties["serv"]) if properties["serv"] is not None else None,
+            name=properties.get("name"),
+            geometry_type=geometry_type,
+            geometry=shape(geometry),
         )
 
-    return beats
-
 
 def _single_value_or_raise(
     field_name: str, beat_id: int, values: set[Any], strict: bool
@@ -193,7 +290,14 @@ def _single_value_or_raise(
 
 
 def _merge_beat_geometry(beat_id: int, geometries: list[BaseGeometry]) -> BaseGeometry:
-    merged = unary_union(geometries)
+    # Most beats have one or two source features; skip unary_union's collection setup for those.
+    if len(geometries) == 1:
+        merged = geometries[0]
+    elif len(geometries) == 2:
+        merged = geometries[0].union(geometries[1])
+    else:
+        # Shapely 2 accepts an object array and unions it in a single GEOS call.
+        merged = unary_union(np.asarray(geometries, dtype=object))
 
     if merged.geom_type == "GeometryCollection":
         polygon_parts = [
@@ -212,45 +316,56 @@ def _merge_beat_geometry(beat_id: int, geometries: list[BaseGeometry]) -> BaseGe
     return merged
 
 
-def consolidate_beats(beats: list[dict[str, Any]], strict: bool) -> list[dict[str, Any]]:
-    grouped: dict[int, list[dict[str, Any]]] = defaultdict(list)
+def consolidate_beats(beats: Iterable[RawBeat], strict: bool) -> list[dict[str, Any]]:
+    grouped: dict[int, list[RawBeat]] = defaultdict(list)
     for beat in beats:
-        grouped[beat["beat"]].append(beat)
+        grouped[beat.beat].append(beat)
 
     consolidated: list[dict[str, Any]] = []
     for beat_id, group in grouped.items():
-        geometries = [
-            shape({"type": row["geometry_type"], "coordinates": row["coordinates"]})
-            for row in group
-        ]
+        geometries: list[BaseGeometry] = []
+        divs: set[Any] = set()
+        servs: set[Any] = set()
+        first_name: str | None = None
+        has_name_conflict = False
+        source_objectids: list[int] = []
+        source_null_name_count = 0
+        for row in group:
+            geometries.append(row.geometry)
+            divs.add(row.div)
+            servs.add(row.serv)
+            source_objectids.append(row.objectid)
+            if row.name is None:
+                source_null_name_count += 1
+            elif first_name is None:
+                first_name = row.name
+            elif row.name != first_name:
+                has_name_conflict = True
+        source_objectids.sort()
+
         merged_geom = _merge_beat_geometry(beat_id=beat_id, geometries=geometries)
+        rep_point = get_representative_point(merged_geom)
 
         div = _single_value_or_raise(
-            field_name="div",
-            beat_id=beat_id,
-            values={row["div"] for row in group},
-            strict=strict,
+            field_name="div", beat_id=beat_id, values=divs, strict=strict
         )
         serv = _single_value_or_raise(
-            field_name="serv",
-            beat_id=beat_id,
-            values={row["serv"] for row in group},
-            strict=strict,
+            field_name="serv", beat_id=beat_id, values=servs, strict=strict
         )
 
-        non_null_names = sorted({row["name"] for row in group if row["name"] is not None})
-        if len(non_null_names) > 1:
+        consolidated_name = first_name
+        if has_name_conflict:
+            # Only the conflict path needs the full, sorted set of names.
+            non_null_names = sorted({row.name for row in group if row.name is not None})
             message = f"Beat {beat_id} has conflicting non-null names: {non_null_names!r}"
             if strict:
                 raise RuntimeError(message)
             logger.warning("%s; using %r", message, non_null_names[0])
-        consolidated_name = non_null_names[0] if non_null_names else None
+            consolidated_name = non_null_names[0]
 
-        source_objectids = sorted(row["objectid"] for row in group)
-        source_null_name_count = sum(1 for row in group if row["name"] is None)
         consolidated.append(
             {
-                "objectid": min(source_objectids),
+                "objectid": source_objectids[0],
                 "source_objectids": source_objectids,
                 "source_feature_count": len(group),
                 "source_null_name_count": source_null_name_count,
@@ -260,6 +375,8 @@ def consolidate_beats(beats: list[dict[str, Any]], strict: bool) -> list[dict[st
                 "name": consolidated_name,
                 "geometry": merged_geom,
                 "geometry_type": merged_geom.geom_type,
+                "rep_lat": rep_point.y,
+                "rep_lon": rep_point.x,
             }
         )
 
@@ -273,36 +390,182 @@ def get_representative_point(geom: BaseGeometry) -> Point:
     return geom.representative_point()
 
 
-def find_nearest_station(point: Point, stations: list[dict[str, Any]]) -> dict[str, Any]:
-    beat_coords = (point.y, point.x)
-    nearest: dict[str, Any] | None = None
-    min_distance = float("inf")
+def _station_coords_radians(stations: Sequence[Station]) -> tuple[np.ndarray, np.ndarray]:
+    if stations is WEATHER_STATIONS:
+        return _ST_LAT_RAD, _ST_LON_RAD
+    lat = np.array([s.lat for s in stations], dtype=np.float64)
+    lon = np.array([s.lon for s in stations], dtype=np.float64)
+    return np.radians(lat), np.radians(lon)
+
+
+def _station_ball_tree(stations: Sequence[Station]):
+    global _STATION_TREE
+    if stations is WEATHER_STATIONS and _STATION_TREE is not None:
+        return _STATION_TREE
+    tree = BallTree(np.column_stack(_station_coords_radians(stations)), metric="haversine")
+    if stations is WEATHER_STATIONS:
+        _STATION_TREE = tree
+    return tree
+
+
+def _haversine_km_matrix(
+    points_rad: np.ndarray, st_lat_rad: np.ndarray, st_lon_rad: np.ndarray
+) -> np.ndarray:
+    """Great-circle distances (km) between (B, 2) points and S stations, shape (B, S)."""
+    plat = points_rad[:, 0:1]
+    plon = points_rad[:, 1:2]
+    slat = st_lat_rad[None, :]
+    slon = st_lon_rad[None, :]
+
+    dlat = plat - slat
+    dlon = plon - slon
+    a = np.sin(dlat / 2) ** 2 + np.cos(plat) * np.cos(slat) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if _HAS_NUMBA:
+
+    # fastmath without nnan/ninf: the reduction below must be able to compare against
+    # its sentinel, which LLVM may fold away if told no value can be inf.
+    @njit(parallel=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+    def nearest_station_kernel(
+        pts_rad: np.ndarray, st_lat_rad: np.ndarray, st_lon_rad: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Fused haversine + argmin per point, without (B, S) temporaries."""
+        n_points = pts_rad.shape[0]
+        n_stations = st_lat_rad.shape[0]
+        out_idx = np.empty(n_points, np.int64)
+        out_d = np.empty(n_points)
+        for b in prange(n_points):
+            plat = pts_rad[b, 0]
+            plon = pts_rad[b, 1]
+            cos_plat = np.cos(plat)
+            best_idx = 0
+            # Haversine `a` is at most 1.0, so any station beats this finite sentinel.
+            best_a = 2.0
+            for s in range(n_stations):
+                slat = st_lat_rad[s]
+                a = (
+                    np.sin((slat - plat) / 2) ** 2
+                    + cos_plat * np.cos(slat) * np.sin((st_lon_rad[s] - plon) / 2) ** 2
+                )
+                # haversine distance is monotonic in `a`, so compare before arcsin/sqrt.
+                if a < best_a:
+                    best_a = a
+                    best_idx = s
+            out_idx[b] = best_idx
+            out_d[b] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(best_a))
+        return out_idx, out_d
+
+
+def find_nearest_stations(
+    points_rad: np.ndarray, stations: Sequence[Station]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (station index, distance km) of the nearest station for each (lat, lon) row."""
+    if not stations:
+        raise RuntimeError("No weather station candidates were provided.")
+
+    if BallTree is not None and len(stations) >= BALLTREE_MIN_STATIONS:
+        dist_rad, idx = _station_ball_tree(stations).query(points_rad, k=1)
+        return idx[:, 0], dist_rad[:, 0] * EARTH_RADIUS_KM
+
+    if _HAS_NUMBA:
+        return nearest_station_kernel(
+            np.ascontiguousarray(points_rad), *_station_coords_radians(stations)
+        )
+
+    dists = _haversine_km_matrix(points_rad, *_station_coords_radians(stations))
+    nearest_idx = dists.argmin(axis=1)
+    nearest_d = dists[np.arange(len(points_rad)), nearest_idx]
+    return nearest_idx, nearest_d
+
+
+def _station_voronoi_tree(stations: Sequence[Station]) -> tuple[shapely.STRtree, float]:
+    """STRtree of Voronoi cells, index-aligned with ``stations``, plus the lon scale.
+
+    Cells are built in an equirectangular projection (lon scaled by cos of the
+    mean latitude) so planar bisectors track great-circle distance at county scale.
+    """
+    global _VORONOI_TREE
+    if stations is WEATHER_STATIONS and _VORONOI_TREE is not None:
+        return _VORONOI_TREE
 
-    for station in stations:
-        station_coords = (station["lat"], station["lon"])
-        distance_km = geodesic(beat_coords, station_coords).kilometers
-        if distance_km < min_distance:
-            min_distance = distance_km
-            nearest = station.copy()
-            nearest["distance_km"] = round(distance_km, 2)
+    st_lat_rad, st_lon_rad = _station_coords_radians(stations)
+    x_scale = math.cos(float(np.mean(st_lat_rad)))
+    min_lon, min_lat, max_lon, max_lat = SAN_DIEGO_COUNTY_BOUNDS
+    extent = box(min_lon * x_scale, min_lat, max_lon * x_scale, max_lat)
 
-    if nearest is None:
+    sites = shapely.multipoints(
+        shapely.points(np.degrees(st_lon_rad) * x_scale, np.degrees(st_lat_rad))
+    )
+    regions = shapely.voronoi_polygons(sites, extend_to=extent, ordered=True)
+    cells = shapely.intersection(np.asarray(regions.geoms, dtype=object), extent)
+    tree = (shapely.STRtree(cells), x_scale)
+    if stations is WEATHER_STATIONS:
+        _VORONOI_TREE = tree
+    return tree
+
+
+def assign_stations_by_voronoi(
+    points_rad: np.ndarray, stations: Sequence[Station]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Same contract as find_nearest_stations, but via point-in-Voronoi-cell lookup.
+
+    Points outside every cell (beyond the county bounds or exactly on an edge)
+    fall back to the haversine nearest station.
+    """
+    if not stations:
         raise RuntimeError("No weather station candidates were provided.")
-    return nearest
+
+    tree, x_scale = _station_voronoi_tree(stations)
+    query_points = shapely.points(np.degrees(points_rad[:, 1]) * x_scale, np.degrees(points_rad[:, 0]))
+    point_idx, cell_idx = tree.query(query_points, predicate="within")
+
+    nearest_idx = np.full(len(points_rad), -1, dtype=np.int64)
+    nearest_idx[point_idx] = cell_idx
+    unassigned = nearest_idx < 0
+    if unassigned.any():
+        nearest_idx[unassigned], _ = find_nearest_stations(points_rad[unassigned], stations)
+
+    st_lat_rad, st_lon_rad = _station_coords_radians(stations)
+    plat, plon = points_rad[:, 0], points_rad[:, 1]
+    slat, slon = st_lat_rad[nearest_idx], st_lon_rad[nearest_idx]
+    a = np.sin((slat - plat) / 2) ** 2 + np.cos(plat) * np.cos(slat) * np.sin((slon - plon) / 2) ** 2
+    return nearest_idx, 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def find_nearest_station(point: Point, stations: Sequence[Station]) -> dict[str, Any]:
+    nearest_idx, nearest_d = find_nearest_stations(np.radians([[point.y, point.x]]), stations)
+    st = stations[int(nearest_idx[0])]
+    return {
+        "station_id": st.station_id,
+        "name": st.name,
+        "location": st.location,
+        "distance_km": round(float(nearest_d[0]), 2),
+    }
 
 
 def build_beat_station_mapping(
-    geojson_path: Path, stations: list[dict[str, Any]], strict: bool
+    geojson_path: Path,
+    stations: Sequence[Station],
+    strict: bool,
+    assignment: str = "nearest",
 ) -> list[dict[str, Any]]:
     validate_stations(stations)
-    geojson_data = load_geojson(geojson_path)
-    raw_beats = extract_beats(geojson_data)
+    raw_beats = extract_beats(iter_features(geojson_path))
     beats = consolidate_beats(raw_beats, strict=strict)
     mapping: list[dict[str, Any]] = []
 
-    for beat in beats:
-        rep_point = get_representative_point(beat["geometry"])
-        nearest_station = find_nearest_station(point=rep_point, stations=stations)
+    pts = np.radians(
+        np.array([(beat["rep_lat"], beat["rep_lon"]) for beat in beats], dtype=np.float64).reshape(-1, 2)
+    )
+    if assignment == "voronoi":
+        nearest_idx, nearest_d = assign_stations_by_voronoi(pts, stations)
+    else:
+        nearest_idx, nearest_d = find_nearest_stations(pts, stations)
+
+    for beat, idx, distance_km in zip(beats, nearest_idx, nearest_d):
+        nearest_station = stations[int(idx)]
 
         mapping.append(
             {
@@ -315,12 +578,12 @@ def build_beat_station_mapping(
                 "serv": beat["serv"],
                 "name": beat["name"],
                 "geometry_type": beat["geometry_type"],
-                "representative_lat": round(rep_point.y, 6),
-                "representative_lon": round(rep_point.x, 6),
-                "station_id": nearest_station["station_id"],
-                "station_name": nearest_station["name"],
-                "station_location": nearest_station["location"],
-                "distance_to_station_km": nearest_station["distance_km"],
+                "representative_lat": round(beat["rep_lat"], 6),
+                "representative_lon": round(beat["rep_lon"], 6),
+                "station_id": nearest_station.station_id,
+                "station_name": nearest_station.name,
+                "station_location": nearest_station.location,
+                "distance_to_station_km": round(float(distance_km), 2),
             }
         )
 
@@ -329,8 +592,11 @@ def build_beat_station_mapping(
 
 def save_mapping(mapping: list[dict[str, Any]], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+    else:
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(mapping, f, indent=2)
     logger.info("Saved beat-to-station mapping: %s", output_path)
 
 
@@ -375,7 +641,10 @@ def main() -> None:
 
     logger.info("Loading beat data from: %s", input_path)
     mapping = build_beat_station_mapping(
-        geojson_path=input_path, stations=WEATHER_STATIONS, strict=args.strict
+        geojson_path=input_path,
+        stations=WEATHER_STATIONS,
+        strict=args.strict,
+        assignment=args.assignment,
     )
     save_mapping(mapping=mapping, output_path=output_path)
     validate_mapping(mapping)
@@ -22,17 +22,18 @@ def get_sql_files():
             files.extend(sorted(directory.glob("*.sql")))
     return files
 
-def execute_sql_file(conn: psycopg.Connection, path: Path):
+def execute_sql_file(cur: psycopg.Cursor, path: Path):
     sql = path.read_text(encoding="utf-8")
     if not sql.strip():
         logger.warning("Skipping empty SQL file: path=%s", path)
         return
-    with conn.cursor() as cur:
-        try:
-            cur.execute(sql)
-            logger.info("Executed SQL file: path=%s", path)
-        except Exception:
-            logger.exception("Error executing SQL file: path=%s", path)
+    try:
+        cur.execute(sql)
+        logger.info("Executed SQL file: path=%s", path)
+    except Exception:
+        # Re-raise so the surrounding transaction rolls back every file, not just this one.
+        logger.exception("Error executing SQL file: path=%s", path)
+        raise
 
 def main():
     configure_logging(service="scripts.migrate")
@@ -40,11 +41,13 @@ def main():
     if not files:
         logger.warning("No SQL files found in configured directories.")
         return
-    with get_connection() as conn:
+    with get_connection() as conn, conn.transaction(), conn.cursor() as cur:
+        # SET LOCAL so the setting doesn't leak onto the pooled connection.
+        cur.execute("SET LOCAL client_min_messages = WARNING")
         for file in files:
             rel = file.relative_to(PROJECT_ROOT)
             logger.info("Executing SQL file: path=%s", rel)
-            execute_sql_file(conn, file)
+            execute_sql_file(cur, file)
     logger.info("All SQL files executed.")
 if __name__ == "__main__":
     main()
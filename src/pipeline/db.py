@@ -1,6 +1,47 @@
 from __future__ import annotations
+import atexit
 import os
+import threading
+from contextlib import AbstractContextManager
 import psycopg
+from psycopg_pool import ConnectionPool
 
-def get_connection() -> psycopg.Connection:
-    return psycopg.connect(host=os.getenv("DB_HOST", "127.0.0.1"), port=int(os.getenv("DB_PORT", "5433")), dbname=os.getenv("DB_NAME", "sdpwarehouse"), user=os.getenv("DB_USER", "postgres"), password=os.getenv("DB_PASSWORD", "admin"))
+def _conninfo() -> str:
+    return psycopg.conninfo.make_conninfo(host=os.getenv("DB_HOST", "127.0.0.1"), port=int(os.getenv("DB_PORT", "5433")), dbname=os.getenv("DB_NAME", "sdpwarehouse"), user=os.getenv("DB_USER", "postgres"), password=os.getenv("DB_PASSWORD", "admin"))
+
+# Opened lazily on first use so importing this module never touches the network.
+_POOL = ConnectionPool(conninfo=_conninfo(), min_size=1, max_size=int(os.getenv("DB_POOL_MAX", "4")), open=False)
+# Guards the one-time open (a psycopg pool cannot be opened twice) and resizes.
+_POOL_LOCK = threading.Lock()
+_POOL_OPENED = False
+
+def _close_pool() -> None:
+    with _POOL_LOCK:
+        if _POOL_OPENED and not _POOL.closed:
+            _POOL.close()
+
+atexit.register(_close_pool)
+
+def reserve_connections(count: int) -> None:
+    """Grow the pool so count threads can each hold a connection at once.
+
+    DB_POOL_MAX is a floor: callers that fan out (e.g. staging's STAGING_MAX_WORKERS)
+    reserve their worker count here instead of waiting in the pool until PoolTimeout.
+    """
+    with _POOL_LOCK:
+        if count > _POOL.max_size:
+            _POOL.resize(min_size=_POOL.min_size, max_size=count)
+
+def get_connection() -> AbstractContextManager[psycopg.Connection]:
+    """Borrow a pooled connection; use as ``with get_connection() as conn:``.
+
+    The transaction is committed (or rolled back on error) when the block exits
+    and the connection goes back to the pool instead of being closed.
+    """
+    global _POOL_OPENED
+    if not _POOL_OPENED:
+        with _POOL_LOCK:
+            if not _POOL_OPENED:
+                _POOL.open()
+                _POOL_OPENED = True
+    return _POOL.connection()
@@ -4,11 +4,19 @@ import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; JsonFormatter falls back to the stdlib encoder.
+    orjson = None
 
-_RESERVED_RECORD_FIELDS = set(logging.makeLogRecord({}).__dict__.keys())
+
+_RESERVED_RECORD_FIELDS = frozenset(logging.makeLogRecord({}).__dict__.keys())
+_RESERVED_LEN = len(_RESERVED_RECORD_FIELDS)
+_CONFIGURED: bool = False
 
 
 def _parse_bool(value: str | None, default: bool) -> bool:
@@ -18,12 +26,15 @@ def _parse_bool(value: str | None, default: bool) -> bool:
 
 
 def _extract_extra_fields(record: logging.LogRecord) -> dict[str, Any]:
-    extras: dict[str, Any] = {}
-    for key, value in record.__dict__.items():
-        if key in _RESERVED_RECORD_FIELDS or key.startswith("_"):
-            continue
-        extras[key] = value
-    return extras
+    fields = record.__dict__
+    # A record with no extra= carries exactly the standard attributes; skip the scan.
+    if len(fields) <= _RESERVED_LEN:
+        return {}
+    return {
+        key: value
+        for key, value in fields.items()
+        if key not in _RESERVED_RECORD_FIELDS and not key.startswith("_")
+    }
 
 
 class JsonFormatter(logging.Formatter):
@@ -33,7 +44,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
             "level": record.levelname,
             "logger": record.name,
             "service": self.service,
@@ -46,6 +57,15 @@ class JsonFormatter(logging.Formatter):
 
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
+        # The two encoders render some extras differently: orjson writes datetimes as ISO
+        # 8601, enums by value, non-ASCII unescaped and NaN as null, where json.dumps gives
+        # str(), str(), \u escapes and a bare NaN. Both always emit a record.
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            except orjson.JSONEncodeError:
+                # e.g. ints past 64 bits, which orjson rejects without consulting default.
+                pass
         return json.dumps(payload, default=str, separators=(",", ":"))
 
 
@@ -55,7 +75,8 @@ class TextFormatter(logging.Formatter):
         self.service = service
 
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+        # record.created is already stamped by the logger; don't take a second clock reading.
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + "+0000"
         message = (
             f"{timestamp} {record.levelname} {record.name} service={self.service} "
             f"message={record.getMessage()}"
@@ -72,6 +93,12 @@ class TextFormatter(logging.Formatter):
 
 
 def configure_logging(level: str | None = None, service: str = "sdpipe") -> None:
+    # Idempotent: later calls (e.g. every warm Lambda invocation) keep the first setup
+    # instead of rebuilding the root handler. Use reconfigure_logging() to force it.
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
     env_level = level or os.getenv("LOG_LEVEL", "INFO")
     resolved_level = getattr(logging, env_level.upper(), logging.INFO)
     aws_runtime = bool(os.getenv("AWS_LAMBDA_FUNCTION_NAME"))
@@ -85,6 +112,13 @@ def configure_logging(level: str | None = None, service: str = "sdpipe") -> None
     root_logger.addHandler(handler)
     root_logger.setLevel(resolved_level)
     logging.captureWarnings(True)
+    _CONFIGURED = True
+
+
+def reconfigure_logging(level: str | None = None, service: str = "sdpipe") -> None:
+    global _CONFIGURED
+    _CONFIGURED = False
+    configure_logging(level=level, service=service)
 
 
 def get_logger(name: str) -> logging.Logger:
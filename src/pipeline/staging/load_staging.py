@@ -1,16 +1,51 @@
 import os
 import io
+import re
 import csv
+import psycopg
+import queue
+import threading
+from collections import Counter
+from contextlib import closing
+from functools import lru_cache
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from pipeline.staging.data_config import STAGING_DATASETS, StagingDataConfig
-from pipeline.db import get_connection
+from pipeline.db import get_connection, reserve_connections
 from pipeline.logging_config import configure_logging, get_logger
 from pipeline.storage.object_store import ObjectStore
+from pipeline.staging.adapters import LocalFileAdapter, S3Adapter, SourceAdapter
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; only needed for STAGING_CSV_ENGINE=pyarrow
+    pa = pc = pa_csv = None
 
 logger = get_logger(__name__)
 
+# Byte-range parsing: smallest range worth a separate GET, and how far past a split
+# point we read looking for the next newline.
+_MIN_RANGE_BYTES = 8 << 20
+_RANGE_PROBE_BYTES = 64 << 10
+_PRODUCER_DONE = object()
+# Parsed batches buffered ahead of the COPY writer on the sequential path.
+_PREFETCH_BATCHES = 4
+# Read granularity for source objects; botocore's StreamingBody otherwise hands the
+# csv module many small reads.
+_READ_BUFFER_BYTES = 4 << 20
+_ARROW_BLOCK_BYTES = 8 << 20
+CSV_ENGINES = ("csv", "pyarrow")
+
+@lru_cache(maxsize=1)
 def _get_batch_size() -> int:
-    raw = os.getenv("STAGING_BATCH_SIZE", "2000")
+    # Rows per batch handed from the parser to the COPY writer and per copy.write().
+    # 10k keeps queue and write overhead low without holding many rows in memory;
+    # psycopg already streams the COPY to the server in buffered chunks, so there is
+    # no separate driver-side page size to tune.
+    raw = os.getenv("STAGING_BATCH_SIZE", "10000")
     try:
         batch_size = int(raw)
     except ValueError as exc:
@@ -19,6 +54,82 @@ def _get_batch_size() -> int:
         raise RuntimeError(f"STAGING_BATCH_SIZE must be > 0, got: {batch_size}")
     return batch_size
 
+def _get_max_workers() -> int:
+    default = min(len(STAGING_DATASETS), os.cpu_count() or 1)
+    raw = os.getenv("STAGING_MAX_WORKERS", str(default))
+    try:
+        max_workers = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"STAGING_MAX_WORKERS must be an integer, got: {raw!r}") from exc
+    if max_workers <= 0:
+        raise RuntimeError(f"STAGING_MAX_WORKERS must be > 0, got: {max_workers}")
+    return max_workers
+
+def _get_parse_workers() -> int:
+    raw = os.getenv("STAGING_PARSE_WORKERS", "1")
+    try:
+        parse_workers = int(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"STAGING_PARSE_WORKERS must be an integer, got: {raw!r}") from exc
+    if parse_workers <= 0:
+        raise RuntimeError(f"STAGING_PARSE_WORKERS must be > 0, got: {parse_workers}")
+    return parse_workers
+
+class _StreamingBodyReader(io.RawIOBase):
+    """Raw-IO adapter over a source stream (e.g. a botocore StreamingBody) for io.BufferedReader."""
+
+    def __init__(self, body) -> None:
+        self._body = body
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._body.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+def _open_binary_stream(body) -> io.BufferedReader:
+    return io.BufferedReader(_StreamingBodyReader(body), buffer_size=_READ_BUFFER_BYTES)
+
+def _open_text_stream(body) -> io.TextIOWrapper:
+    # newline="" leaves line endings to the csv module (quoted fields may contain them);
+    # TextIOWrapper decodes a whole buffered chunk at a time.
+    return io.TextIOWrapper(_open_binary_stream(body), encoding="utf-8", newline="")
+
+def _get_csv_engine() -> str:
+    engine = os.getenv("STAGING_CSV_ENGINE", "csv").strip().lower()
+    if engine not in CSV_ENGINES:
+        raise RuntimeError(f"STAGING_CSV_ENGINE must be one of {CSV_ENGINES}, got: {engine!r}")
+    if engine == "pyarrow" and pa_csv is None:
+        raise RuntimeError("STAGING_CSV_ENGINE=pyarrow requires the pyarrow package to be installed.")
+    return engine
+
+def _get_unlogged() -> bool:
+    # UNLOGGED swap tables skip WAL for the load. The swapped-in table stays unlogged:
+    # Postgres empties it after a crash and it is not replicated, so a crash means the
+    # staging load has to be rerun. Acceptable for tables rebuilt every run.
+    return os.getenv("STAGING_UNLOGGED", "").strip().lower() in {"1", "true", "yes", "on"}
+
+def _get_spool_download() -> bool:
+    return os.getenv("STAGING_SPOOL_DOWNLOAD", "").strip().lower() in {"1", "true", "yes", "on"}
+
+SOURCE_KINDS = ("s3", "local")
+
+def _get_source() -> SourceAdapter:
+    kind = os.getenv("STAGING_SOURCE_KIND", "s3").strip().lower()
+    if kind == "s3":
+        return S3Adapter(ObjectStore(), spool_download=_get_spool_download())
+    if kind == "local":
+        return LocalFileAdapter(os.getenv("STAGING_LOCAL_BASE_DIR", "."))
+    raise RuntimeError(f"STAGING_SOURCE_KIND must be one of {SOURCE_KINDS}, got: {kind!r}")
+
 def _get_run_date() -> date:
     raw = os.getenv("STAGING_RUN_DATE")
     if not raw:
@@ -28,26 +139,31 @@ def _get_run_date() -> date:
     except ValueError as exc:
         raise RuntimeError(f"STAGING_RUN_DATE must be in YYYY-MM-DD format, got: {raw!r}") from exc
 
-def _resolve_source_key(config: StagingDataConfig, run_date: date, store: ObjectStore) -> str:
+def _source_prefix(run_date: date) -> str:
     source_root = os.getenv("STAGING_SOURCE_ROOT", "").rstrip("/")
     if not source_root:
         raise RuntimeError("STAGING_SOURCE_ROOT is required for staging load.")
-    key = f"{source_root}/{run_date.isoformat()}/{config.daily_file_name}"
-    if not store.object_exists(key):
-        raise RuntimeError(f"Source file not found for dataset {config.name!r}: bucket={store.bucket_name!r} key={key!r}")
+    return f"{source_root}/{run_date.isoformat()}/"
+
+def _resolve_source_key(config: StagingDataConfig, prefix: str, existing_keys: set[str], adapter: SourceAdapter) -> str:
+    key = f"{prefix}{config.daily_file_name}"
+    if key not in existing_keys:
+        raise RuntimeError(f"Source file not found for dataset {config.name!r}: location={adapter.location!r} key={key!r}")
     return key
 
+_COLUMN_SETS = {config.name: frozenset(config.columns) for config in STAGING_DATASETS}
+
 def _validate_header(config: StagingDataConfig, fieldnames: list[str] | None) -> None:
     if not fieldnames:
         raise RuntimeError(f"No CSV header found for dataset {config.name}.")
 
-    normalized_headers = [h.strip() for h in fieldnames if h is not None]
-    duplicates = sorted({h for h in normalized_headers if normalized_headers.count(h) > 1})
+    counts = Counter(map(str.strip, fieldnames))
+    duplicates = sorted(h for h, n in counts.items() if n > 1)
     if duplicates:
         raise RuntimeError(f"Dataset {config.name} has duplicate header columns: {duplicates}")
 
-    expected = set(config.columns)
-    actual = set(normalized_headers)
+    expected = _COLUMN_SETS.get(config.name) or frozenset(config.columns)
+    actual = counts.keys()
 
     missing_columns = sorted(expected - actual)
     if missing_columns:
@@ -58,60 +174,105 @@ def _validate_header(config: StagingDataConfig, fieldnames: list[str] | None) ->
     if unexpected_columns:
         raise RuntimeError(f"Dataset {config.name} has unexpected columns: {unexpected_columns}")
 
-def _normalize_row(config: StagingDataConfig, row: dict[str, str | None], snapshot_dt: date, source_file: str, row_num: int) -> tuple[object, ...]:
-    row_values: list[object] = []
-    for col in config.columns:
-        raw = row.get(col)
-        if raw is None:
-            value: object = None
+# Per-column (name, source index, required, integer) resolved once per dataset.
+_ColumnSpec = tuple[str, int, bool, bool]
+
+# Batches are lines of Postgres COPY text format: tab-separated, \N for NULL.
+_COPY_NULL = "\\N"
+_COPY_SPECIAL = re.compile(r"[\\\t\n\r]")
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def _copy_escape(value: str) -> str:
+    return value.translate(_COPY_ESCAPES) if _COPY_SPECIAL.search(value) else value
+
+def _copy_row_suffix(snapshot_dt: date, source_file: str) -> str:
+    # snapshot_dt and source_file are constant per dataset, so they are rendered once.
+    return f"\t{snapshot_dt.isoformat()}\t{_copy_escape(source_file)}\n"
+
+def _missing_value(config: StagingDataConfig, row_num: int, col: str) -> RuntimeError:
+    return RuntimeError(f"Dataset {config.name} row {row_num}: required column {col} is missing/empty")
+
+def _invalid_integer(config: StagingDataConfig, row_num: int, col: str, value: str) -> RuntimeError:
+    return RuntimeError(f"Dataset {config.name} row {row_num}: invalid integer for {col}: {value!r}")
+
+@lru_cache(maxsize=None)
+def _make_normalizer(config: StagingDataConfig, column_specs: tuple[_ColumnSpec, ...], validate_ints: bool = False):
+    """Compile a row -> COPY line function specialized to one dataset's header layout.
+
+    Column positions, null checks and escaping are inlined as straight-line code, so the
+    per-row loop has no per-field branching on the specs. Integer text is passed through
+    for Postgres to parse unless validate_ints is set (the diagnostic re-read).
+    """
+    lines = ["def normalize(row, row_suffix, row_num):"]
+    for i, (col, idx, required, is_int) in enumerate(column_specs):
+        v = f"v{i}"
+        # str.strip() returns the same object when there is nothing to trim, so clean
+        # fields cost no allocation; a Python-level precheck is slower than the call.
+        lines.append(f"    {v} = row[{idx}].strip()")
+        lines.append(f"    if {v} == '':")
+        lines.append(f"        raise missing(row_num, {col!r})" if required else f"        {v} = NULL")
+        if is_int and validate_ints:
+            lines += [
+                "    else:",
+                "        try:",
+                f"            {v} = str(int({v}))",
+                "        except ValueError as exc:",
+                f"            raise invalid(row_num, {col!r}, {v}) from exc",
+            ]
         else:
-            trimmed = raw.strip()
-            value = trimmed if trimmed != "" else None
-
-        if value is None and col in config.required_columns:
-            raise RuntimeError(f"Dataset {config.name} row {row_num}: required column {col} is missing/empty")
-
-        if value is not None and col in config.integer_columns:
-            try:
-                value = int(str(value))
-            except ValueError as exc:
-                raise RuntimeError(f"Dataset {config.name} row {row_num}: invalid integer for {col}: {value!r}") from exc
-
-        row_values.append(value)
-
-    row_values.append(snapshot_dt)
-    row_values.append(source_file)
-    return tuple(row_values)
-
-def _build_insert_sql(config: StagingDataConfig) -> str:
-    insert_columns = list(config.columns) + ["snapshot_dt", "source_file"]
-    placeholders = ", ".join(["%s"] * len(insert_columns))
-    return (
-        f"INSERT INTO {config.table_name} "
-        f"({', '.join(insert_columns)}) VALUES ({placeholders})"
-    )
-
-def _flush_batch(cur, sql: str, batch: list[tuple[object, ...]]) -> int:
-    if not batch:
-        return 0
-    cur.executemany(sql, batch)
-    flushed = len(batch)
-    batch.clear()
-    return flushed
-
-def _truncate_table(cur, table_name: str) -> int:
-    cur.execute(f"SELECT COUNT(*) FROM {table_name}")
-    existing_rows = cur.fetchone()[0]
-    cur.execute(f"TRUNCATE TABLE {table_name}")
-    return existing_rows
-
-def _preflight_resolve_sources(run_date: date, store: ObjectStore) -> dict[str, str]:
+            lines += [
+                f"    elif SPECIAL({v}):",
+                f"        {v} = {v}.translate(ESCAPES)",
+            ]
+    fields = ", ".join(f"v{i}" for i in range(len(column_specs)))
+    lines.append(f"    return '\\t'.join(({fields},)) + row_suffix")
+    namespace = {
+        "NULL": _COPY_NULL,
+        "SPECIAL": _COPY_SPECIAL.search,
+        "ESCAPES": _COPY_ESCAPES,
+        "missing": lambda row_num, col: _missing_value(config, row_num, col),
+        "invalid": lambda row_num, col, value: _invalid_integer(config, row_num, col, value),
+    }
+    exec(compile("\n".join(lines), f"<normalizer {config.name}>", "exec"), namespace)
+    return namespace["normalize"]
+
+def _build_copy_sql(config: StagingDataConfig, table_name: str) -> str:
+    copy_columns = list(config.columns) + ["snapshot_dt", "source_file"]
+    return f"COPY {table_name} ({', '.join(copy_columns)}) FROM STDIN"
+
+def _create_swap_table(cur, table_name: str) -> str:
+    # Rows are loaded into a fresh table that replaces the live one at the end of the
+    # transaction, so readers keep the previous snapshot until commit and the live
+    # table is only locked for the swap itself.
+    swap_table = f"{table_name}__new"
+    cur.execute(f"DROP TABLE IF EXISTS {swap_table}")
+    # Indexes are rebuilt after the load (one sort each) instead of maintained per row.
+    unlogged = "UNLOGGED " if _get_unlogged() else ""
+    cur.execute(f"CREATE {unlogged}TABLE {swap_table} (LIKE {table_name} INCLUDING ALL EXCLUDING INDEXES)")
+    return swap_table
+
+def _swap_in_table(cur, table_name: str, swap_table: str) -> None:
+    # Staging tables carry plain indexes only (no constraints or dependent views), so
+    # replaying pg_indexes.indexdef recreates them under their original names.
+    schema, _, name = table_name.rpartition(".")
+    cur.execute("SELECT indexdef FROM pg_indexes WHERE schemaname = %s AND tablename = %s", (schema or "public", name))
+    index_defs = [row[0] for row in cur.fetchall()]
+    cur.execute(f"ALTER TABLE {table_name} RENAME TO {name}__old")
+    cur.execute(f"ALTER TABLE {swap_table} RENAME TO {name}")
+    cur.execute(f"DROP TABLE {table_name}__old")
+    for index_def in index_defs:
+        cur.execute(index_def)
+
+def _preflight_resolve_sources(run_date: date, adapter: SourceAdapter) -> dict[str, str]:
     resolved_keys: dict[str, str] = {}
     source_errors: list[str] = []
+    prefix = _source_prefix(run_date)
+    # One listing of the run's folder instead of a HEAD request per dataset.
+    existing_keys = adapter.list_keys(prefix)
 
     for config in STAGING_DATASETS:
         try:
-            resolved_keys[config.name] = _resolve_source_key(config, run_date, store)
+            resolved_keys[config.name] = _resolve_source_key(config, prefix, existing_keys, adapter)
         except Exception as exc:
             source_errors.append(f"{config.name}: {exc}")
 
@@ -124,52 +285,374 @@ def _preflight_resolve_sources(run_date: date, store: ObjectStore) -> dict[str,
     logger.info("Preflight passed: run_date=%s datasets=%s", run_date.isoformat(), len(resolved_keys))
     return resolved_keys
 
-def load_data_set(config: StagingDataConfig, cur, run_date: date, store: ObjectStore, key: str) -> int:
+def _column_layout(config: StagingDataConfig, header: list[str]) -> tuple[int, tuple[_ColumnSpec, ...]]:
+    normalized_header = tuple(map(str.strip, header))
+    positions = {h: i for i, h in enumerate(normalized_header)}
+    required_set = frozenset(config.required_columns)
+    int_set = frozenset(config.integer_columns)
+    column_specs = tuple((c, positions[c], c in required_set, c in int_set) for c in config.columns)
+    return len(normalized_header), column_specs
+
+def _iter_batches(
+    config: StagingDataConfig,
+    rows: Iterable[list[str]],
+    layout: tuple[int, tuple[_ColumnSpec, ...]],
+    snapshot_dt: date,
+    source_file: str,
+    batch_size: int,
+    first_row_num: int = 2,
+    exact_width: bool = False,
+    validate_ints: bool = False,
+) -> Iterator[list[str]]:
+    width, column_specs = layout
+    normalize = _make_normalizer(config, column_specs, validate_ints)
+    row_suffix = _copy_row_suffix(snapshot_dt, source_file)
+    batch: list[str] = []
+    for row_num, row in enumerate(rows, start=first_row_num):
+        if not row:
+            continue
+        if len(row) != width:
+            if exact_width:
+                raise RuntimeError(f"Dataset {config.name} row {row_num}: expected {width} fields, got {len(row)}")
+            if len(row) < width:
+                # Short rows read as empty trailing fields, matching DictReader's restval=None.
+                row += [""] * (width - len(row))
+        batch.append(normalize(row, row_suffix, row_num))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _arrow_int_column(config: StagingDataConfig, col: str, values, first_row_num: int):
+    # Round-trip through int64 so the COPY text carries canonical integers.
+    try:
+        return pc.cast(pc.cast(values, pa.int64()), pa.string())
+    except pa.ArrowInvalid:
+        pass
+    # Arrow rejects some inputs int() accepts (e.g. values past int64); fall back per
+    # value so the error names the same row the csv engine would.
+    texts: list[str | None] = []
+    for offset, value in enumerate(values.to_pylist()):
+        if value is None:
+            texts.append(None)
+            continue
+        try:
+            texts.append(str(int(value)))
+        except ValueError as exc:
+            raise RuntimeError(f"Dataset {config.name} row {first_row_num + offset}: invalid integer for {col}: {value!r}") from exc
+    return pa.array(texts, pa.string())
+
+def _arrow_copy_escape(values):
+    if not pc.any(pc.match_substring_regex(values, _COPY_SPECIAL.pattern)).as_py():
+        return values
+    # Backslash first so the escapes added below are not doubled.
+    for raw, escaped in (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")):
+        values = pc.replace_substring(values, raw, escaped)
+    return values
+
+_ARROW_ROW_RE = re.compile(r"(?:CSV parse error: )?Row #(\d+): ")
+
+def _arrow_parse_error(config: StagingDataConfig, exc: Exception) -> RuntimeError:
+    # Arrow's parse errors (e.g. a short row) name no dataset and count data rows from 1;
+    # restate them like every other staging error, numbering rows from the header line.
+    message = str(exc)
+    match = _ARROW_ROW_RE.search(message)
+    if match is None:
+        return RuntimeError(f"Dataset {config.name}: {message}")
+    return RuntimeError(f"Dataset {config.name} row {int(match.group(1)) + 1}: {message[match.end():]}")
+
+def _iter_arrow_batches(
+    config: StagingDataConfig,
+    source: io.BufferedIOBase,
+    layout: tuple[int, tuple[_ColumnSpec, ...]],
+    snapshot_dt: date,
+    source_file: str,
+    batch_size: int,
+) -> Iterator[list[str]]:
+    """Tokenize, trim, cast and render COPY lines with pyarrow; same output as _iter_batches.
+
+    source must be positioned just past the header line. Unlike the csv engine, rows
+    with the wrong field count are an error, and reported row numbers do not count
+    blank lines.
+    """
+    width, column_specs = layout
+    names = [f"f{i}" for i in range(width)]
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(column_names=names, block_size=_ARROW_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                include_columns=[names[idx] for _, idx, _, _ in column_specs],
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid as exc:
+        raise _arrow_parse_error(config, exc) from exc
+    null_string = pa.scalar(None, pa.string())
+    # binary_join_element_wise puts the tab before the trailing constant columns.
+    row_tail = pa.scalar(_copy_row_suffix(snapshot_dt, source_file)[1:], pa.string())
+    row_num = 2
+    batch: list[str] = []
+    while True:
+        try:
+            record_batch = reader.read_next_batch()
+        except StopIteration:
+            break
+        except pa.ArrowInvalid as exc:
+            raise _arrow_parse_error(config, exc) from exc
+        fields = []
+        for col, idx, required, is_int in column_specs:
+            values = pc.utf8_trim_whitespace(record_batch.column(names[idx]))
+            values = pc.if_else(pc.equal(values, ""), null_string, values)
+            if required and values.null_count:
+                offset = pc.index(pc.is_null(values), True).as_py()
+                raise RuntimeError(f"Dataset {config.name} row {row_num + offset}: required column {col} is missing/empty")
+            values = _arrow_int_column(config, col, values, row_num) if is_int else _arrow_copy_escape(values)
+            fields.append(pc.fill_null(values, _COPY_NULL))
+        row_num += record_batch.num_rows
+
+        batch.extend(pc.binary_join_element_wise(*fields, row_tail, "\t").to_pylist())
+        start = 0
+        while len(batch) - start >= batch_size:
+            yield batch[start : start + batch_size]
+            start += batch_size
+        batch = batch[start:]
+    if batch:
+        yield batch
+
+def _read_header_range(config: StagingDataConfig, adapter: SourceAdapter, key: str) -> tuple[list[str] | None, int]:
+    with closing(adapter.open_stream(key, byte_range=(0, _RANGE_PROBE_BYTES - 1))) as stream:
+        probe = stream.read()
+    newline = probe.find(b"\n")
+    if newline < 0:
+        raise RuntimeError(f"Dataset {config.name}: no header line within first {_RANGE_PROBE_BYTES} bytes of {key!r}")
+    header = next(csv.reader([probe[: newline + 1].decode("utf-8")]), None)
+    return header, newline + 1
+
+def _split_ranges(adapter: SourceAdapter, key: str, start: int, size: int, n: int) -> list[tuple[int, int]]:
+    """Split bytes [start, size) into at most n inclusive ranges, each ending on a newline."""
+    bounds = [start]
+    for i in range(1, n):
+        target = start + (size - start) * i // n
+        if target <= bounds[-1]:
+            continue
+        with closing(adapter.open_stream(key, byte_range=(target, min(target + _RANGE_PROBE_BYTES, size) - 1))) as stream:
+            window = stream.read()
+        newline = window.find(b"\n")
+        if newline < 0:
+            # No line break close to the split point; let the previous range absorb it.
+            continue
+        bounds.append(target + newline + 1)
+    bounds.append(size)
+    return [(a, b - 1) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+def _produce_batches(batches: Iterator[list[str]], out: queue.Queue, stop: threading.Event, error_context: str | None = None) -> None:
+    # Parse side of the producer/consumer split: runs off the cursor's thread so
+    # tokenizing the next batch overlaps the COPY of the previous one.
+    try:
+        for batch in batches:
+            if stop.is_set():
+                return
+            out.put(batch)
+    except Exception as exc:
+        out.put(RuntimeError(f"{exc} [{error_context}]") if error_context else exc)
+    finally:
+        out.put(_PRODUCER_DONE)
+
+def _iter_range_batches(
+    config: StagingDataConfig,
+    adapter: SourceAdapter,
+    key: str,
+    byte_range: tuple[int, int],
+    range_index: int,
+    layout: tuple[int, tuple[_ColumnSpec, ...]],
+    snapshot_dt: date,
+    source_file: str,
+    batch_size: int,
+) -> Iterator[list[str]]:
+    # Only the first range knows its absolute line number (header is line 1).
+    first_row_num = 2 if range_index == 0 else 1
+    with closing(adapter.open_stream(key, byte_range=byte_range)) as stream:
+        reader = csv.reader(_open_text_stream(stream))
+        yield from _iter_batches(config, reader, layout, snapshot_dt, source_file, batch_size, first_row_num, exact_width=True)
+
+def _drain_batches(cur, copy_sql: str, batches: queue.Queue, producers: int, stop: threading.Event) -> int:
+    # Single writer: the cursor owner streams whatever the parse workers hand over into
+    # one COPY for the whole dataset, so the server parses a single statement and there
+    # is no per-batch round-trip. Raising inside the block aborts the COPY.
+    inserted_rows = 0
+    finished = 0
+    error: BaseException | None = None
+    try:
+        with cur.copy(copy_sql) as copy:
+            while finished < producers:
+                item = batches.get()
+                if item is _PRODUCER_DONE:
+                    finished += 1
+                elif isinstance(item, BaseException):
+                    error = error or item
+                    stop.set()
+                elif error is None:
+                    try:
+                        copy.write("".join(item))
+                        inserted_rows += len(item)
+                    except Exception as exc:
+                        error = exc
+                        stop.set()
+            if error is not None:
+                raise error
+    finally:
+        # Opening or closing the COPY can fail with producers still running; they may be
+        # blocked on the full queue, so keep taking from it until each one has finished.
+        if finished < producers:
+            stop.set()
+            while finished < producers:
+                if batches.get() is _PRODUCER_DONE:
+                    finished += 1
+    return inserted_rows
+
+def _load_byte_ranges(
+    config: StagingDataConfig,
+    cur,
+    adapter: SourceAdapter,
+    key: str,
+    parse_workers: int,
+    snapshot_dt: date,
+    source_file: str,
+    batch_size: int,
+) -> int | None:
+    """Parse the object as parallel byte ranges; returns None when it is too small to split.
+
+    Ranges are cut at newlines, so this assumes no quoted field spans lines; a row with
+    the wrong field count fails the load rather than being loaded misaligned.
+    """
+    size = adapter.get_size(key)
+    n_ranges = min(parse_workers, size // _MIN_RANGE_BYTES)
+    if n_ranges < 2:
+        return None
+
+    header, data_start = _read_header_range(config, adapter, key)
+    _validate_header(config, header)
+    layout = _column_layout(config, header)
+    ranges = _split_ranges(adapter, key, data_start, size, n_ranges)
+    logger.info("Parsing dataset in byte ranges: dataset=%s key=%s size=%s ranges=%s", config.name, key, size, len(ranges))
+
+    swap_table = _create_swap_table(cur, config.table_name)
+    logger.info("Created swap table for load: dataset=%s table=%s swap_table=%s", config.name, config.table_name, swap_table)
+    batches: queue.Queue = queue.Queue(maxsize=2 * len(ranges))
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        for range_index, byte_range in enumerate(ranges):
+            range_batches = _iter_range_batches(config, adapter, key, byte_range, range_index, layout, snapshot_dt, source_file, batch_size)
+            error_context = None
+            if range_index > 0:
+                error_context = f"byte range {byte_range[0]}-{byte_range[1]}; row numbers relative to range start"
+            executor.submit(_produce_batches, range_batches, batches, stop, error_context)
+        inserted_rows = _drain_batches(cur, _build_copy_sql(config, swap_table), batches, len(ranges), stop)
+    _swap_in_table(cur, config.table_name, swap_table)
+    return inserted_rows
+
+def _copy_data_set(config: StagingDataConfig, cur, adapter: SourceAdapter, key: str, snapshot_dt: date, source_file: str, batch_size: int) -> int:
+    engine = _get_csv_engine()
+    parse_workers = _get_parse_workers()
+    # pyarrow already tokenizes on its own threads; byte ranges only help the csv engine.
+    if parse_workers > 1 and engine == "csv":
+        ranged_rows = _load_byte_ranges(config, cur, adapter, key, parse_workers, snapshot_dt, source_file, batch_size)
+        if ranged_rows is not None:
+            return ranged_rows
+
+    stream = adapter.open_stream(key)
+    if engine == "pyarrow":
+        source = _open_binary_stream(stream)
+        header = next(csv.reader([source.readline().decode("utf-8")]), None)
+    else:
+        reader = csv.reader(_open_text_stream(stream))
+        header = next(reader, None)
+    _validate_header(config, header)
+    layout = _column_layout(config, header)
+    swap_table = _create_swap_table(cur, config.table_name)
+    logger.info("Created swap table for load: dataset=%s table=%s swap_table=%s", config.name, config.table_name, swap_table)
+    copy_sql = _build_copy_sql(config, swap_table)
+    if engine == "pyarrow":
+        batches = _iter_arrow_batches(config, source, layout, snapshot_dt, source_file, batch_size)
+    else:
+        batches = _iter_batches(config, reader, layout, snapshot_dt, source_file, batch_size)
+    prefetched: queue.Queue = queue.Queue(maxsize=_PREFETCH_BATCHES)
+    stop = threading.Event()
+    producer = threading.Thread(target=_produce_batches, args=(batches, prefetched, stop), name=f"staging-parse-{config.name}", daemon=True)
+    producer.start()
+    try:
+        inserted_rows = _drain_batches(cur, copy_sql, prefetched, 1, stop)
+    finally:
+        producer.join()
+        stream.close()
+    _swap_in_table(cur, config.table_name, swap_table)
+    return inserted_rows
+
+def _find_invalid_row(config: StagingDataConfig, adapter: SourceAdapter, key: str) -> None:
+    """Diagnostic slow path after Postgres rejected a COPY: re-read the source with
+    Python integer validation and raise for the first bad row, if Python finds one."""
+    reader = csv.reader(_open_text_stream(adapter.open_stream(key)))
+    header = next(reader, None)
+    layout = _column_layout(config, header)
+    for _ in _iter_batches(config, reader, layout, date.min, "", _get_batch_size(), validate_ints=True):
+        pass
+
+def load_data_set(config: StagingDataConfig, cur, run_date: date, adapter: SourceAdapter, key: str) -> int:
     try:
         snapshot_dt = run_date
         source_file = key.split("/")[-1]
         batch_size = _get_batch_size()
-        inserted_rows = 0
 
         logger.info("Starting dataset load: dataset=%s table=%s key=%s source_file=%s", config.name, config.table_name, key, source_file)
 
-        stream = store.get_object_stream(key)
-        text_stream = io.TextIOWrapper(stream, encoding="utf-8")
-        reader = csv.DictReader(text_stream)
-        _validate_header(config, reader.fieldnames)
-        truncated_rows = _truncate_table(cur, config.table_name)
-        logger.info("Truncated table before load: dataset=%s table=%s truncated_rows=%s", config.name, config.table_name, truncated_rows)
-        insert_sql = _build_insert_sql(config)
-        batch: list[tuple[object, ...]] = []
-        for row_num, row in enumerate(reader, start=2):
-            normalized_row = _normalize_row(config=config, row=row, snapshot_dt=snapshot_dt, source_file=source_file, row_num=row_num)
-            batch.append(normalized_row)
-            if len(batch) >= batch_size:
-                inserted_rows += _flush_batch(cur, insert_sql, batch)
-
-        inserted_rows += _flush_batch(cur, insert_sql, batch)
+        try:
+            inserted_rows = _copy_data_set(config, cur, adapter, key, snapshot_dt, source_file, batch_size)
+        except psycopg.errors.DataError:
+            # Integer columns are passed through as text and checked by Postgres while
+            # COPYing into the typed swap table; only a rejected load pays for the re-read.
+            _find_invalid_row(config, adapter, key)
+            raise
+
         logger.info("Completed dataset load: dataset=%s table=%s inserted_rows=%s source_file=%s", config.name, config.table_name, inserted_rows, source_file)
         return inserted_rows
     except Exception:
         logger.exception("Dataset load failed: dataset=%s table=%s", config.name, config.table_name)
         raise
 
+def _load_data_set_in_transaction(config: StagingDataConfig, run_date: date, adapter: SourceAdapter, key: str) -> int:
+    # Each worker gets its own connection/cursor; psycopg cursors are not thread-safe.
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            # The load is rerun from S3 on failure, so its commit need not wait for the
+            # WAL flush; a crash may lose a just-committed load but never half-applies it.
+            cur.execute("SET LOCAL synchronous_commit = off")
+            return load_data_set(config, cur, run_date, adapter, key)
+
 def main() -> None:
     configure_logging(level=os.getenv("LOG_LEVEL", "INFO"), service="pipeline.staging")
     run_date = _get_run_date()
-    store = ObjectStore()
+    adapter = _get_source()
     total_inserted_rows = 0
-    logger.info("Starting staging load: run_date=%s datasets=%s bucket=%s", run_date.isoformat(), len(STAGING_DATASETS), store.bucket_name)
+    logger.info("Starting staging load: run_date=%s datasets=%s source=%s", run_date.isoformat(), len(STAGING_DATASETS), adapter.location)
     try:
-        resolved_keys = _preflight_resolve_sources(run_date, store)
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                for config in STAGING_DATASETS:
-                    key = resolved_keys[config.name]
-                    total_inserted_rows += load_data_set(config, cur, run_date, store, key)
+        resolved_keys = _preflight_resolve_sources(run_date, adapter)
+        # Datasets target independent tables, so they load concurrently, each in its own
+        # transaction: a failing dataset rolls back only itself.
+        max_workers = _get_max_workers()
+        reserve_connections(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_load_data_set_in_transaction, config, run_date, adapter, resolved_keys[config.name])
+                for config in STAGING_DATASETS
+            ]
+            for future in as_completed(futures):
+                total_inserted_rows += future.result()
         logger.info("Staging load committed: run_date=%s total_rows=%s", run_date.isoformat(), total_inserted_rows)
     except Exception:
-        logger.exception("Staging load failed and rolled back: run_date=%s", run_date.isoformat())
+        logger.exception("Staging load failed; failed datasets rolled back: run_date=%s", run_date.isoformat())
         raise
 
 if __name__ == "__main__":
@@ -1,4 +1,10 @@
+import io
+import warnings
+from collections.abc import Iterator
+from functools import lru_cache
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from botocore.exceptions import ClientError
 from pipeline.config.object_store_config import ObjectStoreConfig
@@ -7,6 +13,40 @@ from pipeline.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Managed transfers (download_file / download_fileobj / upload_file): objects past 8 MiB
+# move as parallel 8 MiB parts, read and written in 1 MiB io chunks.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 << 20,
+    multipart_chunksize=8 << 20,
+    max_concurrency=16,
+    io_chunksize=1 << 20,
+    use_threads=True,
+)
+# Must stay above TRANSFER_CONFIG.max_concurrency plus any caller-side thread fan-out,
+# or urllib3 discards connections ("Connection pool is full").
+MAX_POOL_CONNECTIONS = 64
+
+@lru_cache(maxsize=None)
+def _s3_client(endpoint: str | None, access_key: str | None, secret_key: str | None, region: str | None):
+    # boto3 clients are thread-safe; building one resolves credentials and loads the
+    # service model, so every ObjectStore with the same connection settings shares one.
+    client_kwargs = {
+        "config": Config(
+            signature_version="s3v4",
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+        ),
+        "region_name": region or "us-east-1",
+    }
+    if endpoint:
+        client_kwargs["endpoint_url"] = endpoint
+    if access_key:
+        client_kwargs["aws_access_key_id"] = access_key
+    if secret_key:
+        client_kwargs["aws_secret_access_key"] = secret_key
+    return boto3.client("s3", **client_kwargs)
+
 class ObjectStore:
     def __init__(self, config: ObjectStoreConfig):      
         self.endpoint = config.endpoint
@@ -14,39 +54,74 @@ class ObjectStore:
         self.secret_key = config.secret_key
         self.region = config.region
         self.bucket_name = config.bucket_name
-        client_kwargs = {
-            "config": Config(signature_version="s3v4"),
-            "region_name": self.region or "us-east-1",
-        }
-        if self.endpoint:
-            client_kwargs["endpoint_url"] = self.endpoint
-        if self.access_key:
-            client_kwargs["aws_access_key_id"] = self.access_key
-        if self.secret_key:
-            client_kwargs["aws_secret_access_key"] = self.secret_key
-        self.client = boto3.client("s3", **client_kwargs)
+        self.client = _s3_client(self.endpoint, self.access_key, self.secret_key, self.region)
+        self.transfer_config = TRANSFER_CONFIG
 
     def _bucket(self, bucket_name: str | None = None) -> str:
         return bucket_name or self.bucket_name
 
+    def iter_objects(self, prefix: str = "", bucket_name: str | None = None, page_size: int = 1000) -> Iterator[str]:
+        """
+        Lazily yield every key under prefix, one list_objects_v2 page at a time.
+        Callers that stop early stop requesting pages. ClientError propagates.
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self._bucket(bucket_name), Prefix=prefix, PaginationConfig={"PageSize": page_size})
+        for page in pages:
+            for obj in page.get("Contents", ()):
+                yield obj["Key"]
+
+    def iter_common_prefixes(self, prefix: str = "", delimiter: str = "/", bucket_name: str | None = None) -> Iterator[str]:
+        """
+        Yield the "directories" directly under prefix; S3 groups the keys server-side,
+        so objects below them are not listed.
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._bucket(bucket_name), Prefix=prefix, Delimiter=delimiter):
+            for common_prefix in page.get("CommonPrefixes", ()):
+                yield common_prefix["Prefix"]
+
     def list_objects(self, prefix: str = "", bucket_name: str | None = None):
         try:
-            response = self.client.list_objects_v2(Bucket=self._bucket(bucket_name), Prefix=prefix)
-            contents = response.get("Contents", [])
-            return [obj["Key"] for obj in contents]
+            return list(self.iter_objects(prefix, bucket_name))
         except ClientError as e:
             logger.exception("Failed to list objects: prefix=%s bucket=%s", prefix, self._bucket(bucket_name))
             return []
     
+    def list_keys(self, prefix: str = "", bucket_name: str | None = None) -> set[str]:
+        """
+        Return every key under prefix as a set.
+        Raises RuntimeError if the listing fails.
+        """
+        bucket = self._bucket(bucket_name)
+        try:
+            return set(self.iter_objects(prefix, bucket_name))
+        except ClientError as e:
+            raise RuntimeError(f"Error listing objects under '{prefix}' in bucket {bucket!r}: {e}") from e
+
     def download_object(self, key: str, destination: str, bucket_name: str | None = None):
         try:
-            self.client.download_file(self._bucket(bucket_name), key, destination)
+            self.client.download_file(self._bucket(bucket_name), key, destination, Config=self.transfer_config)
         except ClientError as e:
             raise RuntimeError(f"Error downloading object '{key}' to '{destination}': {e}") from e
 
+    def get_object_parallel(self, key: str, out_fileobj, bucket_name: str | None = None) -> None:
+        """
+        Download an object into a writable binary file object using parallel ranged GETs.
+        Raises RuntimeError if the object does not exist.
+        """
+        bucket = self._bucket(bucket_name)
+        try:
+            self.client.download_fileobj(bucket, key, out_fileobj, Config=self.transfer_config)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in {"404", "NoSuchKey", "NotFound"}:
+                raise RuntimeError(f"Object not found in bucket {bucket!r}: {key!r}") from e
+            raise
+
     def upload_file(self, source: str, key: str, bucket_name: str | None = None):
         try:
-            self.client.upload_file(source, self._bucket(bucket_name), key)
+            self.client.upload_file(source, self._bucket(bucket_name), key, Config=self.transfer_config)
         except ClientError as e:
             raise RuntimeError(f"Error uploading file '{source}' to '{key}': {e}") from e
     
@@ -62,7 +137,33 @@ class ObjectStore:
             raise RuntimeError(f'Error putting object {key} to bucket {bucket_name} ') from e
     
 
+    def put_object_stream(self, key: str, data: bytes, content_type: str = "application/json", bucket_name: str | None = None):
+        """
+        Upload in-memory bytes through the managed transfer, which switches to parallel
+        multipart uploads once data passes transfer_config.multipart_threshold.
+        """
+        bucket = self._bucket(bucket_name)
+        try:
+            self.client.upload_fileobj(
+                io.BytesIO(data),
+                bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=self.transfer_config,
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            raise RuntimeError(f"Error uploading object {key} to bucket {bucket}") from e
+
     def object_exists(self, key: str, bucket_name: str | None = None) -> bool:
+        """
+        Deprecated: checking before a read costs an extra HEAD round-trip. Call
+        get_object_stream directly and handle the RuntimeError it raises for a missing key.
+        """
+        warnings.warn(
+            "ObjectStore.object_exists is deprecated; call get_object_stream and handle RuntimeError for missing keys",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         try:
             self.client.head_object(Bucket=self._bucket(bucket_name), Key=key)
             return True
@@ -72,15 +173,30 @@ class ObjectStore:
                 return False
             raise
 
-    def get_object_stream(self, key: str, bucket_name: str | None = None):
+    def get_object_size(self, key: str, bucket_name: str | None = None) -> int:
+        bucket = self._bucket(bucket_name)
+        try:
+            response = self.client.head_object(Bucket=bucket, Key=key)
+            return response["ContentLength"]
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in {"404", "NoSuchKey", "NotFound"}:
+                raise RuntimeError(f"Object not found in bucket {bucket!r}: {key!r}") from e
+            raise
+
+    def get_object_stream(self, key: str, bucket_name: str | None = None, byte_range: tuple[int, int] | None = None):
         """
         Stream an object from S3/MinIO without downloading to disk.
         Returns a streaming body that can be wrapped with io.TextIOWrapper.
+        byte_range is an inclusive (first, last) byte offset pair, sent as an HTTP Range GET.
         Raises RuntimeError if the object does not exist or cannot be read.
         """
         try:
             bucket = self._bucket(bucket_name)
-            response = self.client.get_object(Bucket=bucket, Key=key)
+            request = {"Bucket": bucket, "Key": key}
+            if byte_range is not None:
+                request["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+            response = self.client.get_object(**request)
             return response["Body"]
         except ClientError as e:
             code = e.response.get("Error", {}).get("Code")
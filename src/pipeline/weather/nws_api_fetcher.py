@@ -1,3 +1,7 @@
+import asyncio
+import httpx
+import msgspec
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -6,29 +10,115 @@ from pipeline.weather.models import NwsStationObservation
 
 API_URL = 'https://api.weather.gov'
 USER_AGENT = 'SDPipe (contact: camacho_apolinar97@gmail.com)'
+# Sized for concurrent station fetches sharing one session; urllib3 otherwise keeps
+# 10 connections and blocks or discards the rest.
+HTTP_POOL_SIZE = 64
+# GeoJSON is what NWS serves for observations; gzip roughly halves the bytes on the wire.
+NWS_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/geo+json", "Accept-Encoding": "gzip"}
+# Three quick retries: a failing station gives up after ~2s instead of stalling its worker for ~30s.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_SECONDS = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Request targets with the query pre-encoded, keyed by require_qc; the async client
+# resolves the paths against its base_url.
+_LATEST_OBSERVATION_PATHS = {
+    require_qc: "/stations/{}/observations/latest?require_qc=" + str(require_qc).lower()
+    for require_qc in (True, False)
+}
+_LATEST_OBSERVATION_URLS = {require_qc: API_URL + path for require_qc, path in _LATEST_OBSERVATION_PATHS.items()}
 
 
 def _create_https_session() -> requests.Session:
     retries = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429,500,502,503,504],
-        allowed_methods=["GET"]
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_SECONDS,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=["GET"],
+        respect_retry_after_header=True
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
     session = requests.Session()
     session.mount("https://",adapter)
-    session.headers.update({"User-Agent":USER_AGENT})
+    # Connection is an HTTP/1.1-only header, so the HTTP/2 client below must not send it.
+    session.headers.update({**NWS_HEADERS, "Connection": "keep-alive"})
     return session
 
 def create_nws_session() -> requests.Session:
     return _create_https_session()
 
 
+# Validators and body of each station's last 200, kept for the container's lifetime: stations
+# update about hourly, so most repeat fetches come back as a bodiless 304 that reuses the body.
+_observation_cache: dict[tuple[str, bool], tuple[dict[str, str], dict[str, Any]]] = {}
+
+def _conditional_headers(cache_key: tuple[str, bool]) -> dict[str, str]:
+    cached = _observation_cache.get(cache_key)
+    return cached[0] if cached is not None else {}
+
+def _cache_observation(cache_key: tuple[str, bool], response_headers, payload: dict[str, Any]) -> dict[str, Any]:
+    validators = {}
+    if etag := response_headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response_headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        _observation_cache[cache_key] = (validators, payload)
+    else:
+        _observation_cache.pop(cache_key, None)
+    return payload
+
 def fetch_latest_observation_json(station_id: str,require_qc: bool = True,session: requests.Session | None = None) -> dict[str, Any]:
     client = session or _create_https_session()
-    url = API_URL + f"/stations/{station_id}/observations/latest"
-    params = {"require_qc": str(require_qc).lower()}
-    response = client.get(url, params=params, timeout=10)
+    url = _LATEST_OBSERVATION_URLS[require_qc].format(station_id)
+    cache_key = (station_id, require_qc)
+    response = client.get(url, headers=_conditional_headers(cache_key), timeout=10)
+    if response.status_code == 304 and cache_key in _observation_cache:
+        return _observation_cache[cache_key][1]
     response.raise_for_status()
-    return response.json()
+    return _cache_observation(cache_key, response.headers, orjson.loads(response.content))
+
+
+# The async path mirrors the urllib3 Retry policy of the requests session: httpx retries
+# neither statuses nor read failures, so both connection errors and RETRY_STATUSES retry here.
+ASYNC_MAX_ATTEMPTS = RETRY_TOTAL + 1
+ASYNC_TIMEOUT = httpx.Timeout(10.0)
+# Upper bound on any single wait, including a server-sent Retry-After, so one station
+# cannot hold the handler until the Lambda times out.
+ASYNC_MAX_BACKOFF_SECONDS = 10.0
+
+def create_nws_async_client(limit: int = HTTP_POOL_SIZE) -> httpx.AsyncClient:
+    """Must be used (and closed) inside the running event loop."""
+    # HTTP/2 multiplexes the concurrent station requests as streams over one TLS
+    # connection instead of a handshake and slow-start per pooled HTTP/1.1 socket.
+    limits = httpx.Limits(max_connections=limit, max_keepalive_connections=limit)
+    return httpx.AsyncClient(http2=True, base_url=API_URL, headers=NWS_HEADERS, timeout=ASYNC_TIMEOUT, limits=limits)
+
+def _retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    delay = float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF_SECONDS * 2 ** attempt
+    return min(delay, ASYNC_MAX_BACKOFF_SECONDS)
+
+async def fetch_latest_observation_json_async(client: httpx.AsyncClient, station_id: str, require_qc: bool = True) -> dict[str, Any]:
+    url = _LATEST_OBSERVATION_PATHS[require_qc].format(station_id)
+    cache_key = (station_id, require_qc)
+    for attempt in range(ASYNC_MAX_ATTEMPTS):
+        try:
+            response = await client.get(url, headers=_conditional_headers(cache_key))
+        except httpx.TransportError:
+            # Connect/read failures, timeouts and dropped HTTP/2 streams.
+            if attempt + 1 == ASYNC_MAX_ATTEMPTS:
+                raise
+            await asyncio.sleep(_retry_delay(None, attempt))
+            continue
+        if response.status_code == 304 and cache_key in _observation_cache:
+            return _observation_cache[cache_key][1]
+        if response.status_code in RETRY_STATUSES and attempt + 1 < ASYNC_MAX_ATTEMPTS:
+            await asyncio.sleep(_retry_delay(response, attempt))
+            continue
+        response.raise_for_status()
+        return _cache_observation(cache_key, response.headers, orjson.loads(response.content))
+
+
+def parse_observation(raw: dict[str, Any]) -> NwsStationObservation:
+    """Typed view of a fetched observation, for consumers that need one; capture keeps raw dicts."""
+    return msgspec.convert(raw, NwsStationObservation)
@@ -1,24 +1,45 @@
 from __future__ import annotations
-import json
-from pathlib import Path
+import gzip
+import orjson
 import os
 import time
+import asyncio
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import requests
+import httpx
+import msgspec
 from typing import Any
 from pipeline.storage.object_store import ObjectStore
 from pipeline.config.object_store_config import ObjectStoreConfig
 from pipeline.logging_config import configure_logging, get_logger
 from pipeline.weather.models import BeatStationMapping
-from pipeline.weather.nws_api_fetcher import create_nws_session, fetch_latest_observation_json
+from pipeline.weather.nws_api_fetcher import create_nws_async_client, fetch_latest_observation_json_async
 
-TEMP_DIR_ROOT = os.getenv('TEMP_DIR_ROOT', '/tmp')  # Default to /tmp if not set
 TEMP_OBSERVATION_FILE_PREFIX = os.getenv('TEMP_OBSERVATION_FILE_PREFIX','nws_observations')
 DATA_SOURCE = 'https://api.weather.gov'
 SCHEMA_VERSION = 1
+NWS_CONCURRENCY = int(os.getenv('NWS_CONCURRENCY', '32'))
+# Batches are hundreds of near-identical observation dicts and gzip several-fold. They are
+# stored as .json.gz files of type application/gzip, with no Content-Encoding, so every
+# reader (boto3 or HTTP) gets the same gzip bytes and gunzips them itself.
+OBSERVATION_GZIP_LEVEL = 6
+GZIP_CONTENT_TYPE = 'application/gzip'
+# Batches larger than this (serialized) are split into station-hashed shards plus a manifest
+# so consumers can GET them in parallel.
+SHARD_THRESHOLD_BYTES = 8 << 20
+OBSERVATIONS_PER_SHARD = 200
+SHARD_UPLOAD_WORKERS = 16
+# Longest Lambda init waits on the S3 warm-up probe; init as a whole is capped at 10s.
+S3_WARM_UP_TIMEOUT_SECONDS = 2.0
 
 object_store: ObjectStore = None
+# Env vars are fixed for a container's lifetime; resolved on first use and reused.
+mapping_file_key: str | None = None
+_object_store_lock = threading.Lock()
 logger = get_logger(__name__)
+_mapping_decoder = msgspec.json.Decoder(list[BeatStationMapping])
 
 def require_env(var_name):
     value = os.getenv(var_name)
@@ -40,97 +61,192 @@ def get_object_store_config() -> ObjectStoreConfig:
         region=s3_region,
     )
 
-def load_base_stations_mapping_file(object_store: ObjectStore, mapping_file_key: str) -> Path:
-    local_path = Path(TEMP_DIR_ROOT) / mapping_file_key
-    local_path.parent.mkdir(parents=True, exist_ok=True)
-    object_store.download_object(mapping_file_key, str(local_path))
-    return local_path
+def get_object_store() -> ObjectStore:
+    global object_store
+    with _object_store_lock:
+        if object_store is None:
+            object_store = ObjectStore(get_object_store_config())
+    return object_store
+
+def warm_object_store(store: ObjectStore, timeout: float = S3_WARM_UP_TIMEOUT_SECONDS) -> None:
+    """Open the client's TLS connection to the bucket so the first invocation finds it pooled.
+
+    The head_bucket runs on the shared client, whose retry policy (up to 10 adaptive
+    attempts) could outlast Lambda's init budget, so init waits at most timeout seconds
+    and leaves a slow probe to finish in the background.
+    """
+    def probe() -> None:
+        try:
+            store.client.head_bucket(Bucket=store.bucket_name)
+        except Exception:
+            logger.warning("S3 warm-up failed: bucket=%s", store.bucket_name, exc_info=True)
+
+    thread = threading.Thread(target=probe, name="s3-warm-up", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        logger.warning("S3 warm-up still pending after %.1fs; continuing init: bucket=%s", timeout, store.bucket_name)
 
-def build_beat_station_mapping(mapping_file_path:Path)-> list[BeatStationMapping]:
-    if not mapping_file_path.exists():
-        raise FileNotFoundError(f"Mapping file not found at '{mapping_file_path}'")
-    
-    raw_data = json.loads(mapping_file_path.read_text())
-    validated_data = [BeatStationMapping.model_validate(row) for row in raw_data]
-    return validated_data
+def get_mapping_file_key() -> str:
+    global mapping_file_key
+    with _object_store_lock:
+        if mapping_file_key is None:
+            # Raises on every invocation until it is set; only a value is cached.
+            mapping_file_key = require_env('MAPPING_FILE_KEY')
+    return mapping_file_key
+
+def load_beat_station_mapping(object_store: ObjectStore, mapping_file_key: str) -> list[BeatStationMapping]:
+    # Decode straight from the GET body; the mapping never touches /tmp.
+    body = object_store.get_object_stream(mapping_file_key)
+    try:
+        return _mapping_decoder.decode(body.read())
+    finally:
+        body.close()
 
-def get_unique_station_ids(list_of_bts: list[BeatStationMapping])-> set[str]:
-    return {bts.station_id for bts in list_of_bts if bts.station_id}
+def get_unique_station_ids(list_of_bts: list[BeatStationMapping])-> list[str]:
+    # First-seen mapping order: deterministic across runs without sorting.
+    return list(dict.fromkeys(bts.station_id for bts in list_of_bts if bts.station_id))
 
 def build_observation_batch(
     captured_at: datetime,
     observations: list[dict[str, Any]],
-    stations_requested: set[str],
-    failed_stations: set[str]
+    stations_requested: list[str],
+    failed_stations: list[str]
 ) -> dict[str, Any]:
     return {
         "captured_at_utc": captured_at.isoformat(),
-        "stations_requested": sorted(stations_requested),
-        "stations_failed": sorted(failed_stations),
+        "stations_requested": stations_requested,
+        "stations_failed": failed_stations,
         "source": DATA_SOURCE,
         "schema_version": SCHEMA_VERSION,
         "observations": observations
         
     }
 
-def collect_station_observation_json(unique_station_set: set[str]) -> tuple[list[dict[str, Any]], set[str]]:
+async def _fetch_station_observations(station_ids: list[str]) -> dict[str, dict[str, Any] | BaseException]:
+    # Each fetch is one latency-bound HTTPS round-trip; a single event loop keeps up to
+    # NWS_CONCURRENCY of them in flight without a thread per request.
+    semaphore = asyncio.Semaphore(NWS_CONCURRENCY)
+
+    async with create_nws_async_client(limit=NWS_CONCURRENCY) as client:
+        async def bounded_fetch(station_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await fetch_latest_observation_json_async(client, station_id)
+
+        results = await asyncio.gather(*(bounded_fetch(station_id) for station_id in station_ids), return_exceptions=True)
+    return dict(zip(station_ids, results))
+
+def collect_station_observation_json(station_ids: list[str]) -> tuple[list[dict[str, Any]], list[str]]:
     nws_observation_json: list[dict[str, Any]] = []
-    failed_stations: set[str] = set()
+    failed_stations: list[str] = []
     started_at = time.perf_counter()
-    session = create_nws_session()
-    for station_id in unique_station_set:
-        try:
-            response = fetch_latest_observation_json(station_id, session=session)
-            nws_observation_json.append(response)
+    results = asyncio.run(_fetch_station_observations(station_ids))
+    for station_id, result in results.items():
+        if isinstance(result, httpx.HTTPError):
+            failed_stations.append(station_id)
+            logger.warning("NWS request failed for raw json: station_id=%s", station_id, exc_info=result)
+        elif isinstance(result, ValueError):
+            failed_stations.append(station_id)
+            logger.warning("NWS json parse failed: station_id=%s", station_id, exc_info=result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            nws_observation_json.append(result)
             logger.info("Fetched latest observation json: station_id=%s", station_id)
-        except requests.exceptions.RequestException:
-            failed_stations.add(station_id)
-            logger.warning("NWS request failed for raw json: station_id=%s", station_id, exc_info=True)
-        except ValueError:
-            failed_stations.add(station_id)
-            logger.warning("NWS json parse failed: station_id=%s", station_id, exc_info=True)
     elapsed_seconds = time.perf_counter() - started_at
 
     logger.info(
         "NWS raw json collection complete: total_stations=%s successful_observations=%s failed_stations=%s elapsed_seconds=%.3f",
-        len(unique_station_set),
+        len(station_ids),
         len(nws_observation_json),
         len(failed_stations),
         elapsed_seconds,
     )
     return nws_observation_json, failed_stations
 
-def compute_weather_file_key(utc_time_prefix:datetime) -> str:
+def compute_weather_key_prefix(utc_time_prefix:datetime) -> str:
     file_name_prefix = utc_time_prefix.strftime('%Y-%m-%d')
     time_stamp = utc_time_prefix.strftime("%Y-%m-%dT%H-%M-%SZ")
-    return f'{TEMP_OBSERVATION_FILE_PREFIX}/{file_name_prefix}/{time_stamp}.json'
+    return f'{TEMP_OBSERVATION_FILE_PREFIX}/{file_name_prefix}/{time_stamp}'
+
+def compute_weather_file_key(utc_time_prefix:datetime) -> str:
+    return f'{compute_weather_key_prefix(utc_time_prefix)}.json.gz'
+
+def encode_json(payload: dict[str, Any]) -> bytes:
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+def gzip_bytes(data: bytes) -> bytes:
+    # mtime=0 keeps the gzip header, and so the object, deterministic for identical payloads.
+    return gzip.compress(data, compresslevel=OBSERVATION_GZIP_LEVEL, mtime=0)
+
+def shard_observations(observations: list[dict[str, Any]], shard_count: int) -> list[list[dict[str, Any]]]:
+    # crc32 rather than hash(): str hashing is salted per process, and a station should
+    # land in the same shard on every run.
+    shards: list[list[dict[str, Any]]] = [[] for _ in range(shard_count)]
+    for observation in observations:
+        station = (observation.get("properties") or {}).get("station") or ""
+        shards[zlib.crc32(station.encode()) % shard_count].append(observation)
+    return shards
+
+def upload_sharded_batch(object_store: ObjectStore, key_prefix: str, payload: dict[str, Any]) -> str:
+    observations = payload["observations"]
+    shard_count = max(1, len(observations) // OBSERVATIONS_PER_SHARD)
+    shards = shard_observations(observations, shard_count)
+    shard_keys = [f"{key_prefix}/part-{index:03d}.json.gz" for index in range(shard_count)]
+
+    def upload_shard(index: int) -> None:
+        shard_payload = {
+            "captured_at_utc": payload["captured_at_utc"],
+            "schema_version": payload["schema_version"],
+            "shard": index,
+            "observations": shards[index],
+        }
+        object_store.put_object_stream(shard_keys[index], gzip_bytes(encode_json(shard_payload)), content_type=GZIP_CONTENT_TYPE)
+
+    with ThreadPoolExecutor(max_workers=min(shard_count, SHARD_UPLOAD_WORKERS)) as pool:
+        list(pool.map(upload_shard, range(shard_count)))
+
+    # Written last: a manifest only exists once every shard it lists has been uploaded.
+    manifest = {key: value for key, value in payload.items() if key != "observations"}
+    manifest["shards"] = [{"key": key, "observations": len(shard)} for key, shard in zip(shard_keys, shards)]
+    manifest_key = f"{key_prefix}/_manifest.json"
+    object_store.put_object_stream(manifest_key, encode_json(manifest))
+    return manifest_key
 
 
 def lambda_handler(event, context):
     configure_logging(level=os.getenv("LOG_LEVEL", "INFO"), service="pipeline.weather.nws_capture_lambda")
-    global object_store
     try:
-        if object_store is None:
-            object_store_config = get_object_store_config()
-            object_store = ObjectStore(object_store_config)
-        mapping_file_key = require_env('MAPPING_FILE_KEY')
-        mapping_file_path = load_base_stations_mapping_file(object_store, mapping_file_key)
-        beat_to_station = build_beat_station_mapping(mapping_file_path)
-        unique_station_set = get_unique_station_ids(beat_to_station)
+        object_store = get_object_store()
+        beat_to_station = load_beat_station_mapping(object_store, get_mapping_file_key())
+        station_ids = get_unique_station_ids(beat_to_station)
         now_utc = datetime.now(timezone.utc)
-        s3_file_key = compute_weather_file_key(now_utc)
-        nws_observations_json, failed_stations = collect_station_observation_json(unique_station_set)
+        nws_observations_json, failed_stations = collect_station_observation_json(station_ids)
         s3_payload = build_observation_batch(
             captured_at= now_utc,
             observations=nws_observations_json,
-            stations_requested= unique_station_set,
+            stations_requested= station_ids,
             failed_stations= failed_stations
         )
-        json_bytes = json.dumps(s3_payload,default=str).encode('utf-8')
-        object_store.put_object(s3_file_key,json_bytes)
-        logger.info(f'Uploaded NWS Observation batch: key:{s3_file_key}, Observations: {nws_observations_json}, failed: {len(failed_stations)}')
+        json_bytes = encode_json(s3_payload)
+        if len(json_bytes) > SHARD_THRESHOLD_BYTES:
+            manifest_key = upload_sharded_batch(object_store, compute_weather_key_prefix(now_utc), s3_payload)
+            logger.info("Uploaded sharded NWS observation batch: manifest=%s observations=%s failed=%s bytes=%s", manifest_key, len(nws_observations_json), len(failed_stations), len(json_bytes))
+            return
+        s3_file_key = compute_weather_file_key(now_utc)
+        compressed = gzip_bytes(json_bytes)
+        object_store.put_object_stream(s3_file_key, compressed, content_type=GZIP_CONTENT_TYPE)
+        logger.info("Uploaded NWS observation batch: key=%s observations=%s failed=%s bytes=%s compressed_bytes=%s", s3_file_key, len(nws_observations_json), len(failed_stations), len(json_bytes), len(compressed))
     except Exception:
-        logger.exception(f"Unhandled error in nws_capture_lambda")
+        logger.exception("Unhandled error in nws_capture_lambda")
         raise
+
+# Build and warm the client during Lambda's init phase, once per container.
+if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
+    try:
+        warm_object_store(get_object_store())
+    except Exception:
+        logger.warning("ObjectStore init deferred to first invocation", exc_info=True)
+
 if __name__ == "__main__":
     lambda_handler({}, None)
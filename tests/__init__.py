@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The pipeline package lives under src/ and is not installed; run with
+# ``python -m unittest discover -s tests -t .`` from the repository root.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
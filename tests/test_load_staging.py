@@ -0,0 +1,65 @@
+import csv
+import io
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+from pipeline.staging import load_staging
+from pipeline.staging.adapters import LocalFileAdapter
+from pipeline.staging.data_config import STAGING_DATASETS
+
+CONFIG = STAGING_DATASETS[0]
+
+def _write_csv(path: str, rows: int) -> None:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CONFIG.columns)
+    for i in range(rows):
+        writer.writerow([str(i) if col in CONFIG.integer_columns else f"{col}-{i}" for col in CONFIG.columns])
+    with open(path, "w", newline="") as f:
+        f.write(buf.getvalue())
+
+class _CopyFailsCursor:
+    def execute(self, sql, params=None):
+        pass
+
+    def copy(self, sql):
+        raise RuntimeError("copy failed to open")
+
+class CopyOpenFailureTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.adapter = LocalFileAdapter(tmp.name)
+        self.key = CONFIG.daily_file_name
+        _write_csv(os.path.join(tmp.name, self.key), rows=2000)
+
+    def _assert_raises_without_hanging(self, parse_workers: str) -> None:
+        outcome = {}
+
+        def run():
+            try:
+                load_staging._copy_data_set(CONFIG, _CopyFailsCursor(), self.adapter, self.key, date(2024, 1, 2), self.key, batch_size=1)
+            except Exception as exc:
+                outcome["error"] = exc
+
+        env = {"STAGING_PARSE_WORKERS": parse_workers, "STAGING_CSV_ENGINE": "csv"}
+        with mock.patch.dict(os.environ, env), mock.patch.object(load_staging, "_MIN_RANGE_BYTES", 1024):
+            worker = threading.Thread(target=run, daemon=True)
+            worker.start()
+            worker.join(timeout=30)
+        self.assertFalse(worker.is_alive(), "load hung after COPY failed to open")
+        self.assertEqual(str(outcome.get("error")), "copy failed to open")
+        self.assertEqual([t.name for t in threading.enumerate() if t.name.startswith("staging-parse-")], [])
+
+    def test_sequential_load_raises(self):
+        self._assert_raises_without_hanging("1")
+
+    def test_byte_range_load_raises(self):
+        self._assert_raises_without_hanging("4")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import enum
+import json
+import logging
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from pipeline import logging_config
+from pipeline.logging_config import JsonFormatter
+
+class _Color(enum.Enum):
+    RED = 1
+
+def _record(**extra) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "tests", "levelname": "INFO", "levelno": logging.INFO, "msg": "hello"})
+    record.__dict__.update(extra)
+    return record
+
+class JsonFormatterTest(unittest.TestCase):
+    def setUp(self):
+        self.formatter = JsonFormatter(service="tests")
+
+    def test_extra_with_int_keys(self):
+        payload = json.loads(self.formatter.format(_record(counts={1: "a", 2: "b"})))
+        self.assertEqual(payload["context"], {"counts": {"1": "a", "2": "b"}})
+
+    def test_extra_with_int_past_64_bits(self):
+        payload = json.loads(self.formatter.format(_record(big=2**70)))
+        self.assertEqual(payload["context"], {"big": 2**70})
+
+    def _context(self) -> dict:
+        record = _record(when=datetime(2024, 1, 1), color=_Color.RED, place="café", ratio=float("nan"))
+        return json.loads(self.formatter.format(record))["context"]
+
+    @unittest.skipIf(logging_config.orjson is None, "orjson not installed")
+    def test_orjson_rendering_of_extras(self):
+        self.assertEqual(self._context(), {"when": "2024-01-01T00:00:00", "color": 1, "place": "café", "ratio": None})
+        self.assertIn('"place":"café"', self.formatter.format(_record(place="café")))
+
+    def test_stdlib_rendering_of_extras(self):
+        with mock.patch.object(logging_config, "orjson", None):
+            context = self._context()
+            self.assertIn('"place":"caf\\u00e9"', self.formatter.format(_record(place="café")))
+        self.assertEqual({k: v for k, v in context.items() if k != "ratio"}, {"when": "2024-01-01 00:00:00", "color": "_Color.RED", "place": "café"})
+        self.assertNotEqual(context["ratio"], context["ratio"])  # bare NaN round-trips as nan
+
+if __name__ == "__main__":
+    unittest.main()